@@ -10,171 +10,205 @@ bl_info = {
     "category": "Import-Export",
 }
 
+# Тяжелые модули (numpy, bmesh, re, concurrent.futures) импортируются
+# лениво внутри методов, чтобы не замедлять старт Blender при включенном,
+# но не используемом аддоне
 import bpy
-import bmesh
-import re
+import io
+import mmap
+import os
 from bpy.props import StringProperty, BoolProperty
 from bpy_extras.io_utils import ImportHelper, ExportHelper
-from mathutils import Vector
-import os
-from pathlib import Path
-from typing import List, Tuple, Optional
 
 
 class DMDMesh:
-    """Класс для представления DMD меша"""
+    """Класс для представления DMD меша
+
+    Данные хранятся в SoA-раскладке: непрерывные numpy-массивы
+    float32 (N,3)/(N,2) и int32 (N,3) вместо списков кортежей.
+    """
     def __init__(self):
-        self.vertices = []
-        self.faces = []
-        self.texture_vertices = []
-        self.texture_faces = []
+        import numpy as np
+
+        self.vertices = np.empty((0, 3), dtype=np.float32)
+        self.faces = np.empty((0, 3), dtype=np.int32)
+        self.texture_vertices = np.empty((0, 2), dtype=np.float32)
+        self.texture_faces = np.empty((0, 3), dtype=np.int32)
         self.object_name = "TriMesh"
 
 
 class DMDParser:
     """Парсер DMD формата"""
-    
-    NUMBER_REGEX = re.compile(r'-?\d+\.?\d*(?:[eE][+-]?\d+)?')
-    INTEGER_REGEX = re.compile(r'\d+')
-    
+
+    _object_name_regex = None
+    SECTION_MARKERS = {
+        'vertices': b'Mesh vertices:',
+        'faces': b'Mesh faces:',
+        'texture_vertices': b'Texture vertices:',
+        'texture_faces': b'Texture faces:',
+    }
+
     @classmethod
     def parse_file(cls, filepath: str) -> DMDMesh:
         """Парсит DMD файл"""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Пробуем другие кодировки
-            for encoding in ['cp1251', 'latin-1']:
-                try:
-                    with open(filepath, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                raise ValueError(f"Не удалось прочитать файл {filepath}")
-        
-        return cls._parse_content(content)
-    
+        with open(filepath, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Пустой файл нельзя отобразить в память
+                return cls._parse_content(b'')
+            try:
+                return cls._parse_content(mm)
+            finally:
+                mm.close()
+
     @classmethod
-    def _parse_content(cls, content: str) -> DMDMesh:
-        """Парсит содержимое DMD файла"""
-        mesh = DMDMesh()
-        lines = [line.strip() for line in content.split('\n') if line.strip()]
-        
-        current_section = ''
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i]
-            
-            # Определяем объект
-            if line.startswith('New object'):
-                i += 1
-                if i < len(lines):
-                    mesh.object_name = lines[i].replace('()', '').strip()
-                i += 1
-                continue
-            
-            # Определяем секции
-            section_map = {
-                'Mesh vertices:': 'vertices',
-                'Mesh faces:': 'faces', 
-                'Texture vertices:': 'texture_vertices',
-                'Texture faces:': 'texture_faces'
-            }
-            
-            if line in section_map:
-                current_section = section_map[line]
-                i += 1
-                continue
-            
-            # Завершение секций
-            if any(keyword in line.lower() for keyword in ['end', 'new']):
-                current_section = ''
-                i += 1
+    def _get_object_name_regex(cls):
+        """Компилирует регулярку заголовка при первом обращении
+
+        Регулярка сама отбрасывает скобки и пробелы вокруг имени
+        (включая \r из CRLF-файлов), поэтому пост-обработка
+        replace/strip не нужна.
+        """
+        if cls._object_name_regex is None:
+            import re
+            cls._object_name_regex = re.compile(
+                r'New object[ \t\r]*\n[ \t\r]*([^\r\n]*?)[ \t\r]*(?:\(\))?[ \t\r]*(?:\n|$)')
+        return cls._object_name_regex
+
+    @staticmethod
+    def _section_bytes(data, marker: bytes) -> bytes:
+        """Возвращает тело секции между строкой-заголовком и строкой end"""
+        pos = data.find(marker)
+        if pos == -1:
+            return b''
+        start = data.find(b'\n', pos + len(marker))
+        if start == -1:
+            return b''
+        start += 1
+        end = data.find(b'\nend', start - 1)
+        if end == -1:
+            end = len(data)
+        return data[start:end] if end >= start else b''
+
+    @classmethod
+    def _load_section(cls, data, marker: bytes, dtype, ncols: int) -> 'np.ndarray':
+        """Читает числовую секцию одним C-сканом без декодирования"""
+        import numpy as np
+
+        body = cls._section_bytes(data, marker)
+        if not body.strip():
+            return np.empty((0, ncols), dtype=dtype)
+
+        # Число колонок определяем по первой строке, дальше весь блок
+        # разбирается одним strtod-сканом без построчного цикла
+        first_line = body.lstrip()
+        newline = first_line.find(b'\n')
+        row_width = len(first_line[:newline if newline != -1 else len(first_line)].split())
+
+        flat = np.fromstring(body, dtype=dtype, sep=' ')
+        if row_width and flat.size % row_width == 0:
+            arr = flat.reshape(-1, row_width)
+        else:
+            # Запасной путь для секций с неоднородными строками
+            arr = np.loadtxt(io.BytesIO(body), dtype=dtype, ndmin=2)
+        # Лишние колонки (например третья координата у текстурных вершин) отбрасываем
+        return np.ascontiguousarray(arr[:, :ncols])
+
+    # Заголовок до первой числовой секции умещается в несколько строк,
+    # поэтому кодировку определяем по небольшой выборке с начала файла
+    HEADER_SAMPLE_SIZE = 4096
+
+    @classmethod
+    def _decode_header(cls, data) -> str:
+        """Декодирует заголовок файла, определяя кодировку по выборке"""
+        cut = data.find(cls.SECTION_MARKERS['vertices'], 0, cls.HEADER_SAMPLE_SIZE)
+        header = bytes(data[:cut if cut != -1 else min(len(data), cls.HEADER_SAMPLE_SIZE)])
+        if header.isascii():
+            # Подавляющее большинство DMD целиком ASCII — декодер не нужен
+            return header.decode('ascii')
+        for encoding in ('utf-8', 'cp1251', 'latin-1'):
+            try:
+                return header.decode(encoding)
+            except UnicodeDecodeError:
                 continue
-            
-            # Парсим данные
-            if current_section == 'vertices':
-                coords = cls.NUMBER_REGEX.findall(line)
-                if len(coords) >= 3:
-                    mesh.vertices.append((
-                        float(coords[0]),
-                        float(coords[1]),
-                        float(coords[2])
-                    ))
-            
-            elif current_section == 'faces':
-                indices = cls.INTEGER_REGEX.findall(line)
-                if len(indices) >= 3:
-                    mesh.faces.append((
-                        int(indices[0]) - 1,  # Конвертируем из 1-based в 0-based
-                        int(indices[1]) - 1,
-                        int(indices[2]) - 1
-                    ))
-            
-            elif current_section == 'texture_vertices':
-                coords = cls.NUMBER_REGEX.findall(line)
-                if len(coords) >= 2:
-                    mesh.texture_vertices.append((
-                        float(coords[0]),
-                        float(coords[1])
-                    ))
-            
-            elif current_section == 'texture_faces':
-                indices = cls.INTEGER_REGEX.findall(line)
-                if len(indices) >= 3:
-                    mesh.texture_faces.append((
-                        int(indices[0]) - 1,
-                        int(indices[1]) - 1,
-                        int(indices[2]) - 1
-                    ))
-            
-            i += 1
-        
+        return ''
+
+    @classmethod
+    def _parse_content(cls, data) -> DMDMesh:
+        """Парсит содержимое DMD файла (байты или mmap) поблочно через numpy"""
+        import numpy as np
+
+        mesh = DMDMesh()
+
+        # Декодируем только маленький заголовок, числовые секции — чистый ASCII
+        name_match = cls._get_object_name_regex().search(cls._decode_header(data))
+        if name_match and name_match.group(1):
+            mesh.object_name = name_match.group(1)
+
+        mesh.vertices = cls._load_section(data, cls.SECTION_MARKERS['vertices'], np.float32, 3)
+        mesh.faces = cls._load_section(data, cls.SECTION_MARKERS['faces'], np.int32, 3)
+        mesh.texture_vertices = cls._load_section(data, cls.SECTION_MARKERS['texture_vertices'], np.float32, 2)
+        mesh.texture_faces = cls._load_section(data, cls.SECTION_MARKERS['texture_faces'], np.int32, 3)
+
+        # Конвертируем из 1-based в 0-based одним векторным вычитанием
+        mesh.faces -= 1
+        mesh.texture_faces -= 1
+
         return mesh
 
     @classmethod
     def write_file(cls, mesh: DMDMesh, filepath: str) -> None:
-        """Записывает DMD меш в файл"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("New object\n")
-            f.write(f"{mesh.object_name}()\n")
-            f.write("numverts numfaces\n")
-            f.write(f"   {len(mesh.vertices):8}   {len(mesh.faces):8}\n")
-            
-            f.write("Mesh vertices:\n")
-            for vertex in mesh.vertices:
-                f.write(f"\t{vertex[0]:.6f} {vertex[1]:.6f} {vertex[2]:.6f}\n")
-            f.write("end vertices\n")
-            
-            f.write("Mesh faces:\n")
-            for face in mesh.faces:
-                # Конвертируем обратно в 1-based индексы
-                f.write(f"\t{face[0] + 1:6} {face[1] + 1:6} {face[2] + 1:6}\n")
-            f.write("end faces\n")
-            f.write("end mesh\n")
-            
-            # Текстурные координаты
-            if mesh.texture_vertices:
-                f.write("New Texture:\n")
-                f.write("numtverts numtvfaces\n")
-                f.write(f"   {len(mesh.texture_vertices):8}   {len(mesh.texture_faces):8}\n")
-                
-                f.write("Texture vertices:\n")
-                for tvert in mesh.texture_vertices:
-                    f.write(f"\t{tvert[0]:.6f} {tvert[1]:.6f} 0.000000\n")
-                f.write("end texture vertices\n")
-                
-                f.write("Texture faces:\n")
-                for tface in mesh.texture_faces:
-                    f.write(f"\t{tface[0] + 1:6} {tface[1] + 1:6} {tface[2] + 1:6}\n")
-                f.write("end texture faces\n")
-                f.write("end of texture\n")
-            
-            f.write("end of file\n")
+        """Записывает DMD меш в файл одной бинарной записью"""
+        import numpy as np
+
+        vertices = np.asarray(mesh.vertices, dtype=np.float32).reshape(-1, 3)
+        faces = np.asarray(mesh.faces, dtype=np.int32).reshape(-1, 3)
+        texture_vertices = np.asarray(mesh.texture_vertices, dtype=np.float32).reshape(-1, 2)
+        texture_faces = np.asarray(mesh.texture_faces, dtype=np.int32).reshape(-1, 3)
+
+        def format_block(arr, fmt):
+            buf = io.BytesIO()
+            np.savetxt(buf, arr, fmt=fmt)
+            return buf.getvalue()
+
+        # Собираем весь файл в памяти: содержимое — ASCII (кроме имени
+        # объекта), поэтому текстовая обертка с перекодировкой не нужна
+        out = bytearray()
+        out += b"New object\n"
+        out += f"{mesh.object_name}()\n".encode('utf-8')
+        out += b"numverts numfaces\n"
+        out += f"   {len(vertices):8}   {len(faces):8}\n".encode('ascii')
+
+        out += b"Mesh vertices:\n"
+        out += format_block(vertices, '\t%.6f %.6f %.6f')
+        out += b"end vertices\n"
+
+        out += b"Mesh faces:\n"
+        # Конвертируем обратно в 1-based индексы одним сложением
+        out += format_block(faces + 1, '\t%6d %6d %6d')
+        out += b"end faces\n"
+        out += b"end mesh\n"
+
+        # Текстурные координаты
+        if len(texture_vertices):
+            out += b"New Texture:\n"
+            out += b"numtverts numtvfaces\n"
+            out += f"   {len(texture_vertices):8}   {len(texture_faces):8}\n".encode('ascii')
+
+            out += b"Texture vertices:\n"
+            out += format_block(texture_vertices, '\t%.6f %.6f 0.000000')
+            out += b"end texture vertices\n"
+
+            out += b"Texture faces:\n"
+            out += format_block(texture_faces + 1, '\t%6d %6d %6d')
+            out += b"end texture faces\n"
+            out += b"end of texture\n"
+
+        out += b"end of file\n"
+
+        with open(filepath, 'wb') as f:
+            f.write(out)
 
 
 class ImportDMD(bpy.types.Operator, ImportHelper):
@@ -209,6 +243,8 @@ class ImportDMD(bpy.types.Operator, ImportHelper):
     )
     
     def execute(self, context):
+        import numpy as np
+
         try:
             # Парсим DMD файл
             dmd_mesh = DMDParser.parse_file(self.filepath)
@@ -216,59 +252,72 @@ class ImportDMD(bpy.types.Operator, ImportHelper):
             # Создаем меш в Blender
             mesh = bpy.data.meshes.new(dmd_mesh.object_name)
             
-            # Трансформируем вершины если нужно
-            vertices = []
-            for vertex in dmd_mesh.vertices:
-                x, y, z = vertex
-                if self.flip_y:
-                    y = -y
-                if self.flip_z:
-                    z = -z
-                vertices.append((x, y, z))
+            # Трансформируем вершины одним слитым умножением на вектор знаков
+            vertices = dmd_mesh.vertices
+            if self.flip_y or self.flip_z:
+                sign = np.array([1.0,
+                                 -1.0 if self.flip_y else 1.0,
+                                 -1.0 if self.flip_z else 1.0], dtype=np.float32)
+                vertices = vertices * sign
             
             # Трансформируем грани если нужно
-            faces = []
-            for face in dmd_mesh.faces:
-                if self.flip_faces:
-                    faces.append((face[2], face[1], face[0]))
-                else:
-                    faces.append(face)
-            
-            # Создаем меш
-            mesh.from_pydata(vertices, [], faces)
-            mesh.update()
-            
+            faces = dmd_mesh.faces
+            if self.flip_faces:
+                faces = np.ascontiguousarray(faces[:, ::-1])
+
+            # Строим меш напрямую через foreach_set, минуя
+            # поэлементный путь from_pydata
+            n_faces = len(faces)
+            mesh.vertices.add(len(vertices))
+            mesh.vertices.foreach_set('co', np.ascontiguousarray(vertices, dtype=np.float32).ravel())
+
+            mesh.loops.add(n_faces * 3)
+            mesh.loops.foreach_set('vertex_index', faces.ravel())
+
+            mesh.polygons.add(n_faces)
+            # loop_total с Blender 3.6 выводится из loop_start соседнего
+            # полигона и доступен только для чтения
+            mesh.polygons.foreach_set('loop_start', np.arange(0, n_faces * 3, 3, dtype=np.int32))
+
+            # UV заполняем до validate(): пока все 3*n_faces петель на месте,
+            # размеры буферов совпадают, а validate при удалении дефектных
+            # граней подчистит и их UV-данные
             # Добавляем UV координаты если есть
-            if dmd_mesh.texture_vertices and dmd_mesh.texture_faces:
+            if len(dmd_mesh.texture_vertices) and len(dmd_mesh.texture_faces):
                 # Создаем UV слой
                 mesh.uv_layers.new(name="UVMap")
                 uv_layer = mesh.uv_layers.active.data
-                
+
+                tex_verts = dmd_mesh.texture_vertices
+                uv_indices = None
+
                 # Проверяем соответствие граней
                 if len(dmd_mesh.texture_faces) == len(dmd_mesh.faces):
                     # UV грани соответствуют обычным граням
-                    for poly_idx, poly in enumerate(mesh.polygons):
-                        tex_face = dmd_mesh.texture_faces[poly_idx]
-                        
-                        for i, loop_idx in enumerate(poly.loop_indices):
-                            if self.flip_faces:
-                                uv_idx = tex_face[2-i]  # Обращаем порядок для UV тоже
-                            else:
-                                uv_idx = tex_face[i]
-                            
-                            if uv_idx < len(dmd_mesh.texture_vertices):
-                                uv = dmd_mesh.texture_vertices[uv_idx]
-                                uv_layer[loop_idx].uv = (uv[0], 1.0 - uv[1])  # Инвертируем V
-                
-                elif len(dmd_mesh.texture_vertices) == len(dmd_mesh.vertices):
+                    tex_faces = dmd_mesh.texture_faces
+                    if self.flip_faces:
+                        tex_faces = tex_faces[:, ::-1]  # Обращаем порядок для UV тоже
+                    uv_indices = tex_faces.ravel()
+
+                elif len(tex_verts) == len(dmd_mesh.vertices):
                     # UV вершины соответствуют обычным вершинам 1:1
-                    for poly in mesh.polygons:
-                        for i, loop_idx in enumerate(poly.loop_indices):
-                            vert_idx = poly.vertices[i]
-                            if vert_idx < len(dmd_mesh.texture_vertices):
-                                uv = dmd_mesh.texture_vertices[vert_idx]
-                                uv_layer[loop_idx].uv = (uv[0], 1.0 - uv[1])  # Инвертируем V
-            
+                    # (faces уже с учетом flip_faces)
+                    uv_indices = faces.ravel()
+
+                if uv_indices is not None:
+                    # Собираем весь UV-буфер и отдаем одним C-вызовом
+                    uv_flat = np.zeros((len(uv_indices), 2), dtype=np.float32)
+                    valid = (uv_indices >= 0) & (uv_indices < len(tex_verts))
+                    gathered = tex_verts[uv_indices[valid]]
+                    uv_flat[valid, 0] = gathered[:, 0]
+                    uv_flat[valid, 1] = 1.0 - gathered[:, 1]  # Инвертируем V
+                    uv_layer.foreach_set('uv', uv_flat.ravel())
+
+            # Сначала валидация (убирает дефектные грани), потом
+            # перестройка ребер уже по корректным петлям
+            mesh.validate()
+            mesh.update(calc_edges=True)
+
             # Создаем объект
             obj = bpy.data.objects.new(dmd_mesh.object_name, mesh)
             context.collection.objects.link(obj)
@@ -380,26 +429,44 @@ class ExportDMD(bpy.types.Operator, ExportHelper):
             self.report({'ERROR'}, "Нет меш-объектов для экспорта")
             return {'CANCELLED'}
         
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
         base_path = os.path.splitext(self.filepath)[0]
-        exported_count = 0
-        
+
+        # Конвертация объектов идет в главном потоке (RNA нельзя трогать
+        # из других потоков), независимая запись файлов — в пуле потоков
+        write_jobs = []
         for obj in mesh_objects:
             try:
                 # Создаем имя файла для каждого объекта
                 obj_filepath = f"{base_path}_{obj.name}.dmd"
-                
+
                 dmd_mesh = self.object_to_dmd_mesh(context, obj)
-                DMDParser.write_file(dmd_mesh, obj_filepath)
-                exported_count += 1
-                
+                write_jobs.append((dmd_mesh, obj_filepath, obj.name))
+
             except Exception as e:
                 self.report({'WARNING'}, f"Ошибка экспорта объекта {obj.name}: {str(e)}")
-        
+
+        exported_count = 0
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(DMDParser.write_file, dmd_mesh, obj_filepath): obj_name
+                for dmd_mesh, obj_filepath, obj_name in write_jobs
+            }
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is None:
+                    exported_count += 1
+                else:
+                    self.report({'WARNING'}, f"Ошибка экспорта объекта {futures[future]}: {str(error)}")
+
         self.report({'INFO'}, f"Экспортировано {exported_count} объектов в отдельные DMD файлы")
         return {'FINISHED'}
     
     def export_combined_objects(self, context, objects):
         """Экспорт всех объектов в один DMD файл"""
+        import numpy as np
+
         mesh_objects = [obj for obj in objects if obj.type == 'MESH']
         
         if not mesh_objects:
@@ -409,45 +476,45 @@ class ExportDMD(bpy.types.Operator, ExportHelper):
         # Создаем объединенный DMD меш
         combined_mesh = DMDMesh()
         combined_mesh.object_name = "Combined_Scene"
-        
+
+        vertex_chunks = []
+        face_chunks = []
+        texture_vertex_chunks = []
+        texture_face_chunks = []
+
         vertex_offset = 0
         uv_offset = 0
-        
+
         for obj in mesh_objects:
             try:
                 dmd_mesh = self.object_to_dmd_mesh(context, obj)
-                
+
                 # Добавляем вершины
-                combined_mesh.vertices.extend(dmd_mesh.vertices)
-                
-                # Добавляем грани с учетом смещения вершин
-                for face in dmd_mesh.faces:
-                    new_face = (
-                        face[0] + vertex_offset,
-                        face[1] + vertex_offset,
-                        face[2] + vertex_offset
-                    )
-                    combined_mesh.faces.append(new_face)
-                
+                vertex_chunks.append(np.asarray(dmd_mesh.vertices, dtype=np.float32).reshape(-1, 3))
+
+                # Смещаем индексы граней одной векторной операцией
+                faces_np = np.asarray(dmd_mesh.faces, dtype=np.int32).reshape(-1, 3)
+                face_chunks.append(faces_np + vertex_offset)
+
                 # Добавляем UV координаты
-                if dmd_mesh.texture_vertices:
-                    combined_mesh.texture_vertices.extend(dmd_mesh.texture_vertices)
-                    
-                    for tex_face in dmd_mesh.texture_faces:
-                        new_tex_face = (
-                            tex_face[0] + uv_offset,
-                            tex_face[1] + uv_offset,
-                            tex_face[2] + uv_offset
-                        )
-                        combined_mesh.texture_faces.append(new_tex_face)
-                    
+                if len(dmd_mesh.texture_vertices):
+                    texture_vertex_chunks.append(np.asarray(dmd_mesh.texture_vertices, dtype=np.float32).reshape(-1, 2))
+
+                    tex_faces_np = np.asarray(dmd_mesh.texture_faces, dtype=np.int32).reshape(-1, 3)
+                    texture_face_chunks.append(tex_faces_np + uv_offset)
+
                     uv_offset += len(dmd_mesh.texture_vertices)
-                
+
                 vertex_offset += len(dmd_mesh.vertices)
-                
+
             except Exception as e:
                 self.report({'WARNING'}, f"Ошибка обработки объекта {obj.name}: {str(e)}")
-        
+
+        combined_mesh.vertices = np.concatenate(vertex_chunks) if vertex_chunks else np.empty((0, 3), np.float32)
+        combined_mesh.faces = np.concatenate(face_chunks) if face_chunks else np.empty((0, 3), np.int32)
+        combined_mesh.texture_vertices = np.concatenate(texture_vertex_chunks) if texture_vertex_chunks else np.empty((0, 2), np.float32)
+        combined_mesh.texture_faces = np.concatenate(texture_face_chunks) if texture_face_chunks else np.empty((0, 3), np.int32)
+
         DMDParser.write_file(combined_mesh, self.filepath)
         
         self.report({'INFO'}, f"Экспортировано {len(mesh_objects)} объектов в единый DMD файл: {len(combined_mesh.vertices)} вершин, {len(combined_mesh.faces)} граней")
@@ -455,6 +522,8 @@ class ExportDMD(bpy.types.Operator, ExportHelper):
     
     def object_to_dmd_mesh(self, context, obj):
         """Конвертирует Blender объект в DMD меш"""
+        import numpy as np
+
         # Создаем копию меша для модификации
         depsgraph = context.evaluated_depsgraph_get()
         obj_eval = obj.evaluated_get(depsgraph)
@@ -465,6 +534,8 @@ class ExportDMD(bpy.types.Operator, ExportHelper):
         
         # Триангулируем если нужно
         if self.triangulate:
+            import bmesh
+
             bm = bmesh.new()
             bm.from_mesh(mesh)
             bmesh.ops.triangulate(bm, faces=bm.faces[:])
@@ -477,56 +548,54 @@ class ExportDMD(bpy.types.Operator, ExportHelper):
         dmd_mesh = DMDMesh()
         dmd_mesh.object_name = obj.name
         
-        # Экспортируем вершины
-        for vertex in mesh.vertices:
-            co = vertex.co
-            x, y, z = co.x, co.y, co.z
-            
-            if self.flip_y:
-                y = -y
-            if self.flip_z:
-                z = -z
-                
-            dmd_mesh.vertices.append((x, y, z))
+        # Экспортируем вершины одним C-вызовом вместо обхода RNA по элементам
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', coords)
+        coords = coords.reshape(-1, 3)
+
+        if self.flip_y or self.flip_z:
+            # Оба флипа — одно слитое умножение на вектор знаков
+            sign = np.array([1.0,
+                             -1.0 if self.flip_y else 1.0,
+                             -1.0 if self.flip_z else 1.0], dtype=np.float32)
+            coords *= sign
+
+        dmd_mesh.vertices = coords
         
-        # Экспортируем грани
-        for poly in mesh.polygons:
-            if len(poly.vertices) == 3:  # Только треугольники
-                face = list(poly.vertices)
-                if self.flip_faces:
-                    face = [face[2], face[1], face[0]]
-                dmd_mesh.faces.append(tuple(face))
+        # Экспортируем грани: loop_triangles уже содержат всю триангуляцию,
+        # забираем индексы одним C-вызовом без проверок на треугольность
+        tri_count = len(mesh.loop_triangles)
+        tris = np.empty(tri_count * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get('vertices', tris)
+        tris = tris.reshape(-1, 3)
+        if self.flip_faces:
+            tris = tris[:, ::-1].copy()
+        dmd_mesh.faces = tris
         
         # Экспортируем UV координаты
         if self.export_uv and mesh.uv_layers:
             uv_layer = mesh.uv_layers.active.data
-            
-            # Собираем уникальные UV координаты
-            uv_dict = {}
-            uv_list = []
-            
-            for poly in mesh.polygons:
-                if len(poly.vertices) == 3:
-                    face_uvs = []
-                    for loop_idx in poly.loop_indices:
-                        uv = uv_layer[loop_idx].uv
-                        # Инвертируем V обратно для DMD формата
-                        uv_coord = (uv[0], 1.0 - uv[1])
-                        
-                        # Ищем или создаем индекс для этой UV координаты
-                        uv_key = (round(uv_coord[0], 6), round(uv_coord[1], 6))
-                        if uv_key not in uv_dict:
-                            uv_dict[uv_key] = len(uv_list)
-                            uv_list.append(uv_coord)
-                        
-                        face_uvs.append(uv_dict[uv_key])
-                    
-                    if self.flip_faces:
-                        face_uvs = [face_uvs[2], face_uvs[1], face_uvs[0]]
-                    
-                    dmd_mesh.texture_faces.append(tuple(face_uvs))
-            
-            dmd_mesh.texture_vertices = uv_list
+
+            # Забираем все UV одним C-вызовом
+            uv_flat = np.empty(len(uv_layer) * 2, dtype=np.float32)
+            uv_layer.foreach_get('uv', uv_flat)
+            uvs = uv_flat.reshape(-1, 2)
+            # Инвертируем V обратно для DMD формата
+            uvs[:, 1] = 1.0 - uvs[:, 1]
+
+            if len(uvs):
+                # Петли треугольников переводят грани в loop-индексы без цикла
+                tri_loops = np.empty(tri_count * 3, dtype=np.int32)
+                mesh.loop_triangles.foreach_get('loops', tri_loops)
+
+                # Дедупликация через сортировку в C вместо словаря в Python
+                unique_uvs, inverse = np.unique(np.round(uvs, 6), axis=0, return_inverse=True)
+                texture_faces = inverse[tri_loops].reshape(-1, 3).astype(np.int32)
+                if self.flip_faces:
+                    texture_faces = texture_faces[:, ::-1].copy()
+
+                dmd_mesh.texture_vertices = unique_uvs
+                dmd_mesh.texture_faces = texture_faces
         
         # Освобождаем меш
         obj_eval.to_mesh_clear()
@@ -542,105 +611,6 @@ def menu_func_export(self, context):
     self.layout.operator(ExportDMD.bl_idname, text="DMD (.dmd)")
 
 
-def dmd_drop_handler(context, event):
-    """Обработчик drag & drop для DMD файлов"""
-    if not hasattr(event, 'location') or not hasattr(event, 'type'):
-        return False
-    
-    # Проверяем, является ли это событием перетаскивания файла
-    if event.type == 'EVT_DROP':
-        if hasattr(context, 'window_manager') and hasattr(context.window_manager, 'clipboard'):
-            try:
-                # Получаем путь к файлу из clipboard (если он там есть)
-                filepath = context.window_manager.clipboard
-                if filepath and filepath.lower().endswith('.dmd'):
-                    # Вызываем импорт DMD
-                    bpy.ops.import_mesh.dmd('EXEC_DEFAULT', filepath=filepath)
-                    return True
-            except:
-                pass
-    
-    return False
-
-
-class DMD_OT_drop_handler(bpy.types.Operator):
-    """Обработчик для drag & drop DMD файлов"""
-    bl_idname = "wm.dmd_drop_handler"
-    bl_label = "DMD Drop Handler"
-    bl_options = {'REGISTER', 'INTERNAL'}
-    
-    filepath: StringProperty()
-    
-    def execute(self, context):
-        if self.filepath.lower().endswith('.dmd'):
-            try:
-                # Импортируем DMD файл
-                bpy.ops.import_mesh.dmd('EXEC_DEFAULT', filepath=self.filepath)
-                self.report({'INFO'}, f"Импортирован DMD файл: {os.path.basename(self.filepath)}")
-            except Exception as e:
-                self.report({'ERROR'}, f"Ошибка импорта DMD: {str(e)}")
-        return {'FINISHED'}
-
-
-def register_drag_drop():
-    """Регистрация drag & drop обработчика"""
-    try:
-        # Регистрируем обработчик для файлов .dmd
-        def drop_handler_func(context):
-            # Получаем все файлы из drag & drop события
-            dropped_files = getattr(context.window_manager, 'clipboard', '')
-            if dropped_files:
-                files = dropped_files.split('\n')
-                for filepath in files:
-                    filepath = filepath.strip()
-                    if filepath.lower().endswith('.dmd') and os.path.exists(filepath):
-                        bpy.ops.wm.dmd_drop_handler('EXEC_DEFAULT', filepath=filepath)
-                        return True
-            return False
-        
-        # Добавляем в глобальные обработчики
-        if not hasattr(bpy.app.handlers, 'dmd_drop_handlers'):
-            bpy.app.handlers.dmd_drop_handlers = []
-        
-        bpy.app.handlers.dmd_drop_handlers.append(drop_handler_func)
-        
-    except Exception as e:
-        print(f"Не удалось зарегистрировать drag & drop обработчик: {e}")
-
-
-def unregister_drag_drop():
-    """Удаление drag & drop обработчика"""
-    try:
-        if hasattr(bpy.app.handlers, 'dmd_drop_handlers'):
-            bpy.app.handlers.dmd_drop_handlers.clear()
-    except:
-        pass
-
-
-# Альтернативный метод через Space Handler
-class DMD_OT_space_drop(bpy.types.SpaceView3D):
-    """Обработчик перетаскивания в 3D окне"""
-    
-    @classmethod
-    def poll(cls, context):
-        return context.area.type == 'VIEW_3D'
-    
-    def invoke(self, context, event):
-        # Проверяем drag & drop события
-        if event.type == 'EVT_DROP' and hasattr(context, 'active_operator'):
-            try:
-                # Попытка получить информацию о перетаскиваемом файле
-                if hasattr(event, 'ascii') and event.ascii:
-                    filepath = str(event.ascii)
-                    if filepath.lower().endswith('.dmd'):
-                        bpy.ops.import_mesh.dmd('INVOKE_DEFAULT', filepath=filepath)
-                        return {'FINISHED'}
-            except:
-                pass
-        
-        return {'PASS_THROUGH'}
-
-
 # Простой обработчик через файловый браузер
 class DMD_FH_import(bpy.types.FileHandler):
     """File handler для DMD файлов"""
@@ -657,7 +627,6 @@ class DMD_FH_import(bpy.types.FileHandler):
 classes = (
     ImportDMD,
     ExportDMD,
-    DMD_OT_drop_handler,
     DMD_FH_import,
 )
 
@@ -668,20 +637,12 @@ def register():
     
     bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
-    
-    # Регистрируем drag & drop
-    register_drag_drop()
-    
-    print("DMD Import/Export аддон зарегистрирован с поддержкой drag & drop")
 
 
 def unregister():
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
     
-    # Удаляем drag & drop обработчики
-    unregister_drag_drop()
-    
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 